@@ -0,0 +1,54 @@
+// Lazy-load below-the-fold dashboard sections.
+//
+// Every element with the `lazy-section` class names a dcc.Store in its
+// `data-visible-store` attribute. The first time the element scrolls into
+// view, the store is set to true, which lets the section's callbacks run.
+(function () {
+    var SELECTOR = '.lazy-section[data-visible-store]';
+
+    function reveal(el) {
+        window.dash_clientside.set_props(el.dataset.visibleStore, {data: true});
+    }
+
+    var intersection = 'IntersectionObserver' in window
+        ? new IntersectionObserver(function (entries, observer) {
+            entries.forEach(function (entry) {
+                if (entry.isIntersecting) {
+                    observer.unobserve(entry.target);
+                    reveal(entry.target);
+                }
+            });
+        }, {rootMargin: '200px 0px'})
+        : null;
+
+    function watch(el) {
+        if (intersection) {
+            intersection.observe(el);
+        } else {
+            reveal(el);  // No IntersectionObserver: load everything.
+        }
+    }
+
+    // Sections are rendered by React after this script runs. The layout is
+    // static and mounts in one commit, so stop watching the DOM as soon as
+    // the sections appear; this keeps Plotly redraws and hovers free of work.
+    var mutations = new MutationObserver(function (records, observer) {
+        var found = [];
+        records.forEach(function (record) {
+            record.addedNodes.forEach(function (node) {
+                if (node.nodeType !== Node.ELEMENT_NODE) {
+                    return;
+                }
+                if (node.matches(SELECTOR)) {
+                    found.push(node);
+                }
+                found.push.apply(found, node.querySelectorAll(SELECTOR));
+            });
+        });
+        if (found.length) {
+            observer.disconnect();
+            found.forEach(watch);
+        }
+    });
+    mutations.observe(document.documentElement, {childList: true, subtree: true});
+})();
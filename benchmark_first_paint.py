@@ -0,0 +1,146 @@
+"""
+Time-to-first-chart benchmark for spacex-dash-app.py
+=====================================================
+Replays what the Dash renderer does on page load against the app's Flask
+server: fetch the layout, fetch the callback graph, then fire every initial
+callback concurrently (like a browser would) and record when the first
+chart - the success pie chart - has a figure. A second phase then reveals
+every lazy-loaded section (as if the user scrolled to the bottom) and
+fires the callbacks that were deferred, so "all sections loaded" covers
+the same work before and after lazy loading. The app import time is
+reported too, since the initial above-the-fold state is computed there.
+
+Usage:
+    python benchmark_first_paint.py [--runs 20]
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+FIRST_CHART_ID = 'success-pie-chart'
+
+
+def load_dashboard():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    spec = importlib.util.spec_from_file_location('spacex_dash_app', os.path.join(script_dir, 'spacex-dash-app.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def find_props(node, component_id):
+    """Return the props of the component with `component_id` in a layout JSON tree."""
+    if isinstance(node, list):
+        for child in node:
+            found = find_props(child, component_id)
+            if found is not None:
+                return found
+    elif isinstance(node, dict) and 'props' in node:
+        if node['props'].get('id') == component_id:
+            return node['props']
+        return find_props(node['props'].get('children'), component_id)
+    return None
+
+
+def parse_outputs(output):
+    """Split Dash's output string ('id.prop' or '..id.prop...id.prop..') into dicts."""
+    if output.startswith('..'):
+        parts = output[2:-2].split('...')
+    else:
+        parts = [output]
+    outputs = [dict(zip(('id', 'property'), part.rsplit('.', 1))) for part in parts]
+    return outputs if output.startswith('..') else outputs[0]
+
+
+def callback_payload(dependency, layout):
+    def with_value(item):
+        props = find_props(layout, item['id']) or {}
+        return {**item, 'value': props.get(item['property'])}
+
+    return {
+        'output': dependency['output'],
+        'outputs': parse_outputs(dependency['output']),
+        'inputs': [with_value(item) for item in dependency['inputs']],
+        'state': [with_value(item) for item in dependency['state']],
+        'changedPropIds': [],
+    }
+
+
+def visibility_stores(dependencies):
+    """Ids of the dcc.Store inputs that gate lazy-loaded sections."""
+    return {item['id'] for dep in dependencies for item in dep['inputs'] if item['id'].endswith('-visible')}
+
+
+def measure_page_load(server):
+    client = server.test_client()
+    start = time.perf_counter()
+
+    layout_response = client.get('/_dash-layout')
+    layout = layout_response.get_json()
+    layout_done = time.perf_counter() - start
+    dependencies = client.get('/_dash-dependencies').get_json()
+
+    initial = [dep for dep in dependencies if not dep.get('prevent_initial_call')]
+    first_chart_in_layout = (find_props(layout, FIRST_CHART_ID) or {}).get('figure') is not None
+
+    def fire(dependency):
+        response = server.test_client().post(
+            '/_dash-update-component',
+            data=json.dumps(callback_payload(dependency, layout)),
+            content_type='application/json',
+        )
+        return dependency['output'], time.perf_counter() - start, len(response.data)
+
+    with ThreadPoolExecutor(max_workers=max(len(initial), 1)) as pool:
+        results = list(pool.map(fire, initial))
+
+    # Reveal phase: set every *-visible store to true and fire what it gates.
+    stores = visibility_stores(dependencies)
+    for store_id in stores:
+        find_props(layout, store_id)['data'] = True
+    deferred = [dep for dep in dependencies if any(item['id'] in stores for item in dep['inputs'])]
+    with ThreadPoolExecutor(max_workers=max(len(deferred), 1)) as pool:
+        revealed = list(pool.map(fire, deferred))
+
+    if first_chart_in_layout:
+        first_chart = layout_done
+    else:
+        first_chart = next(done for output, done, _ in results if FIRST_CHART_ID in output)
+
+    return {
+        'initial_callbacks': len(initial),
+        'layout_bytes': len(layout_response.data),
+        'callback_bytes': sum(size for _, _, size in results),
+        'first_chart_ms': first_chart * 1000,
+        'deferred_callbacks': len(deferred),
+        'all_loaded_ms': max([layout_done] + [done for _, done, _ in results + revealed]) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    server = load_dashboard().app.server
+    import_ms = (time.perf_counter() - start) * 1000
+    measure_page_load(server)  # warm-up (plotly templates, first JSON encode)
+    runs = [measure_page_load(server) for _ in range(args.runs)]
+
+    print(f"App import (startup)      : {import_ms:.1f} ms")
+    print(f"Initial callback requests : {runs[0]['initial_callbacks']}")
+    print(f"Layout response           : {runs[0]['layout_bytes']:,} bytes")
+    print(f"Initial callback responses: {runs[0]['callback_bytes']:,} bytes")
+    print(f"Time to first chart       : {statistics.median(r['first_chart_ms'] for r in runs):.1f} ms (median of {args.runs})")
+    print(f"Deferred callback requests: {runs[0]['deferred_callbacks']}")
+    print(f"All sections loaded       : {statistics.median(r['all_loaded_ms'] for r in runs):.1f} ms (median of {args.runs})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""
+Insight callback payload benchmark for spacex-dash-app.py
+==========================================================
+Calls every insight callback through the app's Flask server for each
+launch site in the data and reports the JSON response size, the number of
+component properties it updates and the server time per call.
+
+With --browser URL it also drives a running dashboard in headless Chromium
+(requires `playwright`): it switches the site dropdown and records how long
+the insight panels take to settle, and how much of that is client-side
+render time after the last callback response arrived.
+
+Usage:
+    python benchmark_insight_payloads.py [--runs 20] [--browser http://127.0.0.1:8050/]
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+from benchmark_first_paint import callback_payload, load_dashboard
+
+# Insight callbacks, identified by any one of their output ids (the first
+# matches the older single-output form, the second the slot outputs).
+INSIGHT_CALLBACKS = {
+    'stats cards': ('stats-cards.children', 'stat-total.children'),
+    'pie insights': ('pie-insights.children', 'pie-top1-site.children'),
+    'scatter insights': ('scatter-insights.children', 'scatter-total.children'),
+    'orbit insights': ('orbit-insights.children', 'orbit-best.children'),
+    'timeline insights': ('timeline-insights.children', 'timeline-first.children'),
+}
+
+INSIGHT_PANEL_IDS = ['stats-cards', 'pie-insights', 'scatter-insights', 'orbit-insights', 'timeline-insights']
+
+# Switches the site dropdown and resolves once the insight panels have had no
+# DOM mutations for 500 ms. `render` is the time from the last callback
+# response that arrived before the final panel mutation to that mutation.
+MEASURE_JS = """
+async ([site, panelIds]) => {
+    performance.clearResourceTimings();
+    const start = performance.now();
+    let last = start;
+    const observer = new MutationObserver(() => { last = performance.now(); });
+    panelIds.forEach(id => observer.observe(document.getElementById(id),
+        {childList: true, subtree: true, characterData: true, attributes: true}));
+    window.dash_clientside.set_props('site-dropdown', {value: site});
+    await new Promise(resolve => {
+        const check = () => (performance.now() - last > 500 ? resolve() : setTimeout(check, 50));
+        setTimeout(check, 50);
+    });
+    observer.disconnect();
+    const responses = performance.getEntriesByType('resource')
+        .filter(e => e.name.includes('_dash-update-component') && e.responseEnd <= last)
+        .map(e => e.responseEnd);
+    return {total: last - start, render: last - Math.max(start, ...responses)};
+}
+"""
+
+
+def updated_props(response_json):
+    """Number of component properties a callback response sets."""
+    if response_json.get('multi'):
+        return sum(len(props) for props in response_json['response'].values())
+    return 1
+
+
+def measure(server, dependency, layout, site, runs):
+    payload = callback_payload(dependency, layout)
+    for item in payload['inputs']:
+        if item['id'] == 'site-dropdown':
+            item['value'] = site
+        elif item['id'].endswith('-visible'):
+            item['value'] = True
+
+    client = server.test_client()
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        response = client.post('/_dash-update-component', data=json.dumps(payload), content_type='application/json')
+        timings.append(time.perf_counter() - start)
+    return len(response.data), updated_props(response.get_json()), statistics.median(timings) * 1000
+
+
+def measure_in_browser(url, sites, runs):
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        raise SystemExit('--browser requires playwright (pip install playwright && playwright install chromium)')
+
+    # Start from a different site than the page default so every step is a change
+    sequence = [site for _ in range(runs) for site in sites[1:] + sites[:1]]
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch()
+        page = browser.new_page()
+        page.goto(url)
+        page.wait_for_load_state('networkidle')
+        page.evaluate('window.scrollTo(0, document.body.scrollHeight)')  # reveal lazy sections
+        page.wait_for_load_state('networkidle')
+        page.wait_for_timeout(1000)
+        results = [page.evaluate(MEASURE_JS, [site, INSIGHT_PANEL_IDS]) for site in sequence]
+        browser.close()
+    return statistics.median(r['total'] for r in results), statistics.median(r['render'] for r in results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--browser', metavar='URL', help='also measure a running dashboard in headless Chromium')
+    args = parser.parse_args()
+
+    dashboard = load_dashboard()
+    server = dashboard.app.server
+    client = server.test_client()
+    layout = client.get('/_dash-layout').get_json()
+    dependencies = client.get('/_dash-dependencies').get_json()
+    sites = ['ALL'] + sorted(dashboard.load_launch_data()['LaunchSite'].unique())
+
+    print(f"{'callback':<22}{'bytes':>10}{'props set':>11}{'server ms':>12}")
+    total_bytes = total_props = 0
+    for name, output_ids in INSIGHT_CALLBACKS.items():
+        dependency = next(dep for dep in dependencies if any(output_id in dep['output'] for output_id in output_ids))
+        results = [measure(server, dependency, layout, site, args.runs) for site in sites]
+        size, props, server_ms = (statistics.mean(r[i] for r in results) for i in range(3))
+        total_bytes += size
+        total_props += props
+        print(f"{name:<22}{size:>10,.0f}{props:>11.0f}{server_ms:>12.2f}")
+    print(f"{'total (mean per site)':<22}{total_bytes:>10,.0f}{total_props:>11.0f}")
+
+    if args.browser:
+        total_ms, render_ms = measure_in_browser(args.browser, sites, args.runs)
+        print(f"Browser: panels settled in {total_ms:.1f} ms, client render {render_ms:.1f} ms (median of {args.runs * len(sites)})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+"""
+Build the startup snapshot for spacex-dash-app.py
+==================================================
+Parses the launch CSV and computes the initial above-the-fold outputs once,
+offline, and writes them to a single binary file. When that file is present
+and matches the CSV, the dashboard starts from it instead of importing
+pandas/plotly and rebuilding everything at import time.
+
+Usage:
+    python build_snapshot.py [--output spacex_dashboard.snapshot]
+"""
+
+import argparse
+import importlib.util
+import os
+
+# Always build from the CSV, never from an existing snapshot
+os.environ['SPACEX_DASH_SNAPSHOT'] = ''
+
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--output', default=os.path.join(script_dir, 'spacex_dashboard.snapshot'))
+    args = parser.parse_args()
+
+    spec = importlib.util.spec_from_file_location('spacex_dash_app', os.path.join(script_dir, 'spacex-dash-app.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.write_snapshot(args.output)
+    print(f"Wrote {args.output} ({os.path.getsize(args.output):,} bytes)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Import-time profile for spacex-dash-app.py
+===========================================
+Imports the dashboard in a fresh interpreter under `python -X importtime`
+and reports where the cold-start time goes: each top-level package the app
+pulls in, plus the app module's own body (data loading, layout, initial
+figures). Exits with status 1 when the total exceeds --budget-ms.
+
+Usage:
+    python profile_import_time.py [--mode snapshot|csv] [--budget-ms 750]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+APP_MODULE = 'spacex-dash-app'
+LINE_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def run_importtime(mode):
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ)
+    if mode == 'csv':
+        env['SPACEX_DASH_SNAPSHOT'] = ''
+    code = f"import sys; sys.path.insert(0, {script_dir!r}); __import__({APP_MODULE!r})"
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            env=env, capture_output=True, text=True, check=True)
+    return result.stderr.splitlines()
+
+
+def breakdown(lines):
+    """Return (app self time, app total time, {package: cumulative time}) in microseconds."""
+    entries = [(int(m[1]), int(m[2]), len(m[3]), m[4]) for m in map(LINE_RE.match, lines) if m]
+    app = next(entry for entry in entries if entry[3] == APP_MODULE)
+    app_depth = app[2]
+
+    # importtime lists children before their parent, so the app's direct
+    # imports are the entries one level deeper that precede it.
+    packages = defaultdict(int)
+    for self_us, cumulative_us, depth, name in entries[:entries.index(app)]:
+        if depth == app_depth + 2:
+            packages[name.split('.')[0]] += cumulative_us
+    return app[0], app[1], packages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--mode', choices=['snapshot', 'csv'], default='snapshot')
+    parser.add_argument('--budget-ms', type=float, default=750)
+    args = parser.parse_args()
+
+    app_self, app_total, packages = breakdown(run_importtime(args.mode))
+
+    print(f"Import-time profile ({args.mode} mode)")
+    print("-" * 50)
+    for name, cumulative_us in sorted(packages.items(), key=lambda item: -item[1]):
+        if cumulative_us >= 1000:
+            print(f"{name:<32}{cumulative_us / 1000:>10.1f} ms")
+    print(f"{'app module body':<32}{app_self / 1000:>10.1f} ms")
+    print("-" * 50)
+    print(f"{'total':<32}{app_total / 1000:>10.1f} ms")
+
+    if app_total / 1000 > args.budget_ms:
+        print(f"Over budget: {app_total / 1000:.1f} ms > {args.budget_ms:.1f} ms")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -7,24 +7,112 @@ including success rates, payload analysis, and site-specific insights.
 """
 
 # Import required libraries
-import pandas as pd
 import dash
-from dash import dcc, html
+from dash import dcc, html, no_update
 from dash.dependencies import Input, Output
-import plotly.express as px
-import plotly.graph_objects as go
+from dash.exceptions import PreventUpdate
+import functools
+import hashlib
+import importlib
+import importlib.metadata
+import io
+import json
+import os
+import pickle
+import warnings
+import zlib
+from urllib.parse import urlencode
+from flask import Response, abort, request, stream_with_context
+
+
+class LazyModule:
+    """Stand-in for a heavy module that is only imported on first attribute access."""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+# pandas and plotly are only needed once a callback or export actually runs
+pd = LazyModule('pandas')
+px = LazyModule('plotly.express')
+go = LazyModule('plotly.graph_objects')
 
 # ============================================================================
 # DATA LOADING
 # ============================================================================
 
-# Read the SpaceX launch data into pandas dataframe
-import os
 script_dir = os.path.dirname(os.path.abspath(__file__))
 csv_path = os.path.join(script_dir, "spacex_launch_data_clean.csv")
-spacex_df = pd.read_csv(csv_path)
-max_payload = spacex_df['PayloadMass'].max()
-min_payload = spacex_df['PayloadMass'].min()
+
+# Prebuilt startup snapshot (see build_snapshot.py). Set SPACEX_DASH_SNAPSHOT
+# to another path, or to an empty string to always start from the CSV.
+SNAPSHOT_PATH = os.environ.get('SPACEX_DASH_SNAPSHOT', os.path.join(script_dir, 'spacex_dashboard.snapshot'))
+
+
+def snapshot_fingerprint():
+    """Identify everything a snapshot depends on: the CSV, this file's code and library versions."""
+    stat = os.stat(csv_path)
+    with open(os.path.abspath(__file__), 'rb') as f:
+        app_hash = hashlib.sha256(f.read()).hexdigest()
+    return {
+        'csv': (stat.st_size, stat.st_mtime_ns),
+        'app': app_hash,
+        'versions': {name: importlib.metadata.version(name) for name in ('dash', 'pandas', 'plotly')},
+    }
+
+
+def read_snapshot(path):
+    """Load the startup snapshot, or return None if it is missing, unreadable or out of date."""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            data = pickle.load(f)
+    except Exception as err:
+        warnings.warn(f"Ignoring unreadable snapshot {path} ({err!r}); starting from the CSV")
+        return None
+    if not isinstance(data, dict) or data.get('fingerprint') != snapshot_fingerprint():
+        warnings.warn(f"Ignoring stale snapshot {path}; rebuild it with build_snapshot.py")
+        return None
+    return data
+
+
+snapshot = read_snapshot(SNAPSHOT_PATH)
+
+
+@functools.lru_cache(maxsize=None)
+def load_launch_data():
+    """Return the SpaceX launch data as a pandas dataframe (parsed once, on first use)."""
+    if snapshot is not None:
+        try:
+            return pickle.loads(snapshot['launch_data'])
+        except Exception as err:
+            warnings.warn(f"Ignoring unreadable snapshot dataset ({err!r}); reading the CSV")
+    return pd.read_csv(csv_path)
+
+
+if snapshot is not None:
+    min_payload, max_payload = snapshot['min_payload'], snapshot['max_payload']
+else:
+    max_payload = load_launch_data()['PayloadMass'].max()
+    min_payload = load_launch_data()['PayloadMass'].min()
+
+# ============================================================================
+# FILTERING HELPERS
+# ============================================================================
+
+def filter_launches(df, entered_site, payload_range):
+    """Apply the site-dropdown + payload-slider selection to a launch dataframe."""
+    if entered_site != 'ALL':
+        df = df[df['LaunchSite'] == entered_site]
+    low, high = payload_range
+    return df[(df['PayloadMass'] >= low) & (df['PayloadMass'] <= high)]
 
 # ============================================================================
 # DASH APP INITIALIZATION
@@ -78,6 +166,164 @@ subtitle_style = {
     'fontSize': '18px'
 }
 
+# ============================================================================
+# INSIGHT COMPONENTS
+# ============================================================================
+
+# Theme variables and tone classes for assets/insights.css, generated from
+# `colors` so the palette is defined in one place.
+theme_css = ':root {' + ''.join(f' --{name}: {value};' for name, value in colors.items()) + ' }' + ''.join(
+    f' .insight-panel .tone-{name}, .stat-card .tone-{name} {{ color: var(--{name}); }}' for name in colors)
+app.index_string = app.index_string.replace('{%css%}', '{%css%}\n        <style>' + theme_css + '</style>')
+
+# Insight panels and stats cards are static layout: labels and headings are
+# sent once with the page, and the callbacks below only fill in the values
+# (and tone classes) through targeted 'id.property' outputs.
+
+def slot(slot_id):
+    """An empty span inside a static panel whose text is filled in by a callback."""
+    return html.Span(id=slot_id)
+
+
+def slot_outputs(*keys):
+    """Outputs for a callback that returns a dict keyed by 'id.property'."""
+    return {key: Output(*key.rsplit('.', 1)) for key in keys}
+
+
+def fill_outputs(outputs, values):
+    """Complete a callback's return dict, leaving outputs missing from `values` unchanged."""
+    return {key: values.get(key, no_update) for key in outputs}
+
+
+def insight_class(tone=None, strong=False, detail=False):
+    """Class names for an insight line; `tone` is any `colors` key."""
+    classes = [f'tone-{tone}' if tone else '', 'strong' if strong else '', 'insight-detail' if detail else '']
+    return ' '.join(c for c in classes if c)
+
+
+def insight_line(*parts, tone=None, strong=False, detail=False, line_id=None):
+    """An insight bullet built from static text and slot() spans."""
+    line = html.P(list(parts))
+    class_name = insight_class(tone, strong, detail)
+    if class_name:
+        line.className = class_name
+    if line_id:
+        line.id = line_id
+    return line
+
+
+def stat_card(label, value_id, tone, small=False):
+    """A stats card with a static label and a value slot colored by `tone` (a `colors` key)."""
+    return html.Div([html.H3(label), html.H2(id=value_id, className=f'tone-{tone}')],
+                    className='stat-card stat-card--small' if small else 'stat-card')
+
+
+def insight_panel(title, body, compact=False, panel_id=None, hidden=False):
+    """An insight panel: a title followed by headings (html.H4) and lines."""
+    panel = html.Div([html.H3(title), html.Div(body)], hidden=hidden,
+                     className='insight-panel insight-panel--compact' if compact else 'insight-panel')
+    if panel_id:
+        panel.id = panel_id
+    return panel
+
+
+stats_cards_layout = html.Div(className='stats-cards', children=[
+    stat_card('📈 Total Launches', 'stat-total', 'primary'),
+    stat_card('✅ Successful', 'stat-successful', 'success'),
+    stat_card('🎯 Success Rate', 'stat-rate', 'warning'),
+    stat_card('📦 Avg Payload', 'stat-payload', 'secondary', small=True),
+])
+
+pie_insights_layout = [
+    insight_panel('📊 Launch Site Insights', panel_id='pie-insights-all', body=[
+        html.H4('🏆 Top Performing Sites:'),
+        insight_line('• ', slot('pie-top1-site'), ' leads with ', slot('pie-top1-successful'),
+                     ' successful launches (', slot('pie-top1-rate'), ' success rate)'),
+        insight_line('• ', slot('pie-top2-site'), ' has ', slot('pie-top2-successful'),
+                     ' successful launches (', slot('pie-top2-rate'), ' success rate)'),
+
+        html.H4('📈 Total Statistics:'),
+        insight_line('• Total Launches: ', slot('pie-all-total')),
+        insight_line('• Successful: ', slot('pie-all-successful'), ' (', slot('pie-all-success-rate'), ')',
+                     tone='success', strong=True),
+        insight_line('• Failed: ', slot('pie-all-failed'), ' (', slot('pie-all-failed-rate'), ')', tone='danger'),
+
+        html.H4('🎯 Key Findings:'),
+        insight_line('• Most active site: ', slot('pie-most-active-site'), ' (', slot('pie-most-active-total'), ' launches)'),
+        insight_line('• Highest success rate: ', slot('pie-best-rate-site'), ' (', slot('pie-best-rate'), ')'),
+    ]),
+    insight_panel(['📊 ', slot('pie-site-name'), ' Insights'], panel_id='pie-insights-site', hidden=True, body=[
+        html.H4('📈 Performance Metrics:'),
+        insight_line('• Total Launches: ', slot('pie-site-total')),
+        insight_line('• Successful: ', slot('pie-site-successful'), ' (', slot('pie-site-success-rate'), ')',
+                     tone='success', strong=True),
+        insight_line('• Failed: ', slot('pie-site-failed'), ' (', slot('pie-site-failed-rate'), ')', tone='danger'),
+
+        html.H4('🎯 Analysis:'),
+        insight_line('• This site shows a ', slot('pie-site-analysis-rate'), ' success rate'),
+        insight_line('• Average payload: ', slot('pie-site-avg-payload'), ' kg'),
+    ]),
+]
+
+scatter_insights_layout = [
+    insight_panel('📊 Payload Analysis', compact=True, panel_id='scatter-insights-body', body=[
+        html.H4('📈 Range Overview:'),
+        insight_line('• Payload Range: ', slot('scatter-range'), ' kg'),
+        insight_line('• Total Launches: ', slot('scatter-total')),
+        insight_line('• Success Rate: ', slot('scatter-rate'), tone='success', strong=True),
+
+        html.H4('🎯 Correlation:'),
+        insight_line('• Low Payload (<5000kg): ', slot('scatter-low-rate'), ' success (', slot('scatter-low-count'), ' launches)'),
+        insight_line('• High Payload (≥5000kg): ', slot('scatter-high-rate'), ' success (', slot('scatter-high-count'), ' launches)'),
+
+        html.H4('💡 Insight:'),
+        insight_line('• Average payload: ', slot('scatter-avg-payload'), ' kg'),
+        insight_line('• ', slot('scatter-trend'), ' payloads show better success rates', tone='primary', strong=True),
+    ]),
+    insight_panel('📊 Payload Analysis', panel_id='scatter-insights-empty', hidden=True, body=[
+        html.P('No data available for selected filters', className='insight-empty')
+    ]),
+]
+
+orbit_insights_layout = insight_panel('🛰️ Orbit Analysis', [
+    html.H4('🏆 Best Performing:'),
+    insight_line('• ', slot('orbit-best'), ' orbit: ', slot('orbit-best-rate'), ' success rate', tone='success', strong=True),
+    insight_line('  (', slot('orbit-best-successful'), ' of ', slot('orbit-best-total'), ' launches)', detail=True),
+
+    html.H4('📊 Most Common:'),
+    insight_line('• ', slot('orbit-common'), ' orbit: ', slot('orbit-common-total'), ' total launches'),
+    insight_line('  (', slot('orbit-common-rate'), ' success rate)', detail=True),
+
+    html.H4('💡 Key Finding:'),
+    insight_line('• ', slot('orbit-types'), ' different orbit types used at ', slot('orbit-site')),
+    insight_line('• Success rates vary from ', slot('orbit-range-low'), ' to ', slot('orbit-range-high'),
+                 tone='primary', strong=True),
+])
+
+timeline_insights_layout = insight_panel('📅 Timeline Analysis', html.Div(className='insight-columns', children=[
+    html.Div([
+        html.H4('📆 Period Overview:'),
+        insight_line('• First Launch: ', slot('timeline-first')),
+        insight_line('• Latest Launch: ', slot('timeline-last')),
+        insight_line('• Time Span: ', slot('timeline-days'), ' days (', slot('timeline-years'), ' years)'),
+    ]),
+
+    html.Div([
+        html.H4('📈 Performance Trend:'),
+        insight_line('• Early Period: ', slot('timeline-early-rate'), ' success (', slot('timeline-early-count'), ' launches)'),
+        insight_line('• Recent Period: ', slot('timeline-late-rate'), ' success (', slot('timeline-late-count'), ' launches)',
+                     strong=True, line_id='timeline-recent-line'),
+        insight_line('• Improvement: ', slot('timeline-improvement'), line_id='timeline-improvement-line'),
+    ]),
+
+    html.Div([
+        html.H4('💡 Key Insights:'),
+        insight_line('• Overall Success Rate: ', slot('timeline-overall-rate'), tone='primary', strong=True),
+        insight_line('• Performance ', slot('timeline-verdict'), ' over time'),
+        insight_line('• Technology and procedures have ', slot('timeline-outlook')),
+    ]),
+]))
+
 # ============================================================================
 # DASHBOARD LAYOUT
 # ============================================================================
@@ -95,7 +341,7 @@ app.layout = html.Div(
         ]),
         
         # Stats Cards Row
-        html.Div(id='stats-cards', style={'marginBottom': '30px'}),
+        html.Div(stats_cards_layout, id='stats-cards', style={'marginBottom': '30px'}),
         
         # Control Panel
         html.Div(
@@ -133,7 +379,7 @@ app.layout = html.Div(
                 ], style={'width': '60%', 'display': 'inline-block', 'verticalAlign': 'top'}),
                 
                 html.Div([
-                    html.Div(id='pie-insights')
+                    html.Div(pie_insights_layout, id='pie-insights')
                 ], style={'width': '40%', 'display': 'inline-block', 'padding': '20px', 'verticalAlign': 'top'}),
             ]
         ),
@@ -157,22 +403,34 @@ app.layout = html.Div(
             ]
         ),
         
-        # Charts Row 2: Scatter Plot with Insights
+        # Charts Row 2: Scatter Plot with Insights (lazy-loaded)
+        dcc.Store(id='scatter-visible', data=False),
         html.Div(
+            className='lazy-section',
+            **{'data-visible-store': 'scatter-visible'},
             style=card_style,
             children=[
                 html.Div([
-                    dcc.Graph(id='success-payload-scatter-chart')
+                    dcc.Graph(id='success-payload-scatter-chart'),
+                    html.Div([
+                        html.A('⬇️ Download CSV', id='export-csv-link',
+                               style={'color': colors['primary'], 'fontSize': '14px', 'marginRight': '20px'}),
+                        html.A('⬇️ Download Parquet', id='export-parquet-link',
+                               style={'color': colors['primary'], 'fontSize': '14px'}),
+                    ], style={'textAlign': 'right', 'marginTop': '10px'}),
                 ], style={'width': '70%', 'display': 'inline-block', 'verticalAlign': 'top'}),
                 
                 html.Div([
-                    html.Div(id='scatter-insights')
+                    html.Div(scatter_insights_layout, id='scatter-insights')
                 ], style={'width': '30%', 'display': 'inline-block', 'padding': '20px', 'verticalAlign': 'top'}),
             ]
         ),
         
-        # Bar Chart with Insights
+        # Bar Chart with Insights (lazy-loaded)
+        dcc.Store(id='orbit-visible', data=False),
         html.Div(
+            className='lazy-section',
+            **{'data-visible-store': 'orbit-visible'},
             style=card_style,
             children=[
                 html.Div([
@@ -180,13 +438,16 @@ app.layout = html.Div(
                 ], style={'width': '60%', 'display': 'inline-block', 'verticalAlign': 'top'}),
                 
                 html.Div([
-                    html.Div(id='orbit-insights')
+                    html.Div(orbit_insights_layout, id='orbit-insights')
                 ], style={'width': '40%', 'display': 'inline-block', 'padding': '20px', 'verticalAlign': 'top'}),
             ]
         ),
         
-        # Timeline Chart with Insights
+        # Timeline Chart with Insights (lazy-loaded)
+        dcc.Store(id='timeline-visible', data=False),
         html.Div(
+            className='lazy-section',
+            **{'data-visible-store': 'timeline-visible'},
             style=card_style,
             children=[
                 html.Div([
@@ -194,7 +455,7 @@ app.layout = html.Div(
                 ], style={'width': '100%', 'display': 'block'}),
                 
                 html.Div([
-                    html.Div(id='timeline-insights')
+                    html.Div(timeline_insights_layout, id='timeline-insights')
                 ], style={'width': '100%', 'display': 'block', 'padding': '20px 0'}),
             ]
         ),
@@ -216,10 +477,12 @@ app.layout = html.Div(
 
 # Callback for Stats Cards
 @app.callback(
-    Output('stats-cards', 'children'),
-    Input('site-dropdown', 'value')
+    slot_outputs('stat-total.children', 'stat-successful.children', 'stat-rate.children', 'stat-payload.children'),
+    Input('site-dropdown', 'value'),
+    prevent_initial_call=True
 )
 def update_stats_cards(entered_site):
+    spacex_df = load_launch_data()
     if entered_site == 'ALL':
         filtered_df = spacex_df
     else:
@@ -230,37 +493,34 @@ def update_stats_cards(entered_site):
     success_rate = (successful_launches / total_launches * 100) if total_launches > 0 else 0
     avg_payload = filtered_df['PayloadMass'].mean()
     
-    return html.Div(
-        style={'display': 'flex', 'justifyContent': 'space-between', 'gap': '15px', 'flexWrap': 'nowrap'},
-        children=[
-            html.Div([
-                html.H3('📈 Total Launches', style={'color': colors['text'], 'fontSize': '16px', 'marginBottom': '10px', 'fontWeight': '500'}),
-                html.H2(f'{total_launches}', style={'color': colors['primary'], 'fontSize': '36px', 'fontWeight': 'bold', 'margin': '0'})
-            ], style={'backgroundColor': colors['card_bg'], 'padding': '20px', 'borderRadius': '10px', 'textAlign': 'center', 'boxShadow': '0 2px 8px rgba(0, 0, 0, 0.1)', 'border': f'1px solid {colors["border"]}', 'flex': '1'}),
-            
-            html.Div([
-                html.H3('✅ Successful', style={'color': colors['text'], 'fontSize': '16px', 'marginBottom': '10px', 'fontWeight': '500'}),
-                html.H2(f'{int(successful_launches)}', style={'color': colors['success'], 'fontSize': '36px', 'fontWeight': 'bold', 'margin': '0'})
-            ], style={'backgroundColor': colors['card_bg'], 'padding': '20px', 'borderRadius': '10px', 'textAlign': 'center', 'boxShadow': '0 2px 8px rgba(0, 0, 0, 0.1)', 'border': f'1px solid {colors["border"]}', 'flex': '1'}),
-            
-            html.Div([
-                html.H3('🎯 Success Rate', style={'color': colors['text'], 'fontSize': '16px', 'marginBottom': '10px', 'fontWeight': '500'}),
-                html.H2(f'{success_rate:.1f}%', style={'color': colors['warning'], 'fontSize': '36px', 'fontWeight': 'bold', 'margin': '0'})
-            ], style={'backgroundColor': colors['card_bg'], 'padding': '20px', 'borderRadius': '10px', 'textAlign': 'center', 'boxShadow': '0 2px 8px rgba(0, 0, 0, 0.1)', 'border': f'1px solid {colors["border"]}', 'flex': '1'}),
-            
-            html.Div([
-                html.H3('📦 Avg Payload', style={'color': colors['text'], 'fontSize': '16px', 'marginBottom': '10px', 'fontWeight': '500'}),
-                html.H2(f'{avg_payload:,.0f} kg', style={'color': colors['secondary'], 'fontSize': '32px', 'fontWeight': 'bold', 'margin': '0'})
-            ], style={'backgroundColor': colors['card_bg'], 'padding': '20px', 'borderRadius': '10px', 'textAlign': 'center', 'boxShadow': '0 2px 8px rgba(0, 0, 0, 0.1)', 'border': f'1px solid {colors["border"]}', 'flex': '1'}),
-        ]
-    )
+    return {
+        'stat-total.children': f'{total_launches}',
+        'stat-successful.children': f'{int(successful_launches)}',
+        'stat-rate.children': f'{success_rate:.1f}%',
+        'stat-payload.children': f'{avg_payload:,.0f} kg',
+    }
 
 # Callback for Pie Chart Insights
+pie_insight_outputs = slot_outputs(
+    'pie-insights-all.hidden', 'pie-insights-site.hidden',
+    'pie-top1-site.children', 'pie-top1-successful.children', 'pie-top1-rate.children',
+    'pie-top2-site.children', 'pie-top2-successful.children', 'pie-top2-rate.children',
+    'pie-all-total.children', 'pie-all-successful.children', 'pie-all-success-rate.children',
+    'pie-all-failed.children', 'pie-all-failed-rate.children',
+    'pie-most-active-site.children', 'pie-most-active-total.children',
+    'pie-best-rate-site.children', 'pie-best-rate.children',
+    'pie-site-name.children', 'pie-site-total.children', 'pie-site-successful.children',
+    'pie-site-success-rate.children', 'pie-site-failed.children', 'pie-site-failed-rate.children',
+    'pie-site-analysis-rate.children', 'pie-site-avg-payload.children',
+)
+
 @app.callback(
-    Output('pie-insights', 'children'),
-    Input('site-dropdown', 'value')
+    pie_insight_outputs,
+    Input('site-dropdown', 'value'),
+    prevent_initial_call=True
 )
 def update_pie_insights(entered_site):
+    spacex_df = load_launch_data()
     if entered_site == 'ALL':
         filtered_df = spacex_df
         site_success = filtered_df.groupby('LaunchSite').agg({
@@ -269,30 +529,27 @@ def update_pie_insights(entered_site):
         site_success.columns = ['Successful', 'Total', 'Rate']
         site_success = site_success.sort_values('Successful', ascending=False)
         
-        insights = [
-            html.H3('📊 Launch Site Insights', style={'color': colors['primary'], 'marginBottom': '20px'}),
-            html.Div([
-                html.H4('🏆 Top Performing Sites:', style={'color': colors['text'], 'fontSize': '18px', 'marginTop': '15px'}),
-                html.P(f"• {site_success.index[0]} leads with {int(site_success.iloc[0]['Successful'])} successful launches ({site_success.iloc[0]['Rate']*100:.1f}% success rate)", 
-                       style={'color': colors['text'], 'fontSize': '14px', 'marginLeft': '10px'}),
-                html.P(f"• {site_success.index[1]} has {int(site_success.iloc[1]['Successful'])} successful launches ({site_success.iloc[1]['Rate']*100:.1f}% success rate)", 
-                       style={'color': colors['text'], 'fontSize': '14px', 'marginLeft': '10px'}),
-                
-                html.H4('📈 Total Statistics:', style={'color': colors['text'], 'fontSize': '18px', 'marginTop': '20px'}),
-                html.P(f"• Total Launches: {len(filtered_df)}", 
-                       style={'color': colors['text'], 'fontSize': '14px', 'marginLeft': '10px'}),
-                html.P(f"• Successful: {int(filtered_df['Class'].sum())} ({filtered_df['Class'].mean()*100:.1f}%)", 
-                       style={'color': colors['success'], 'fontSize': '14px', 'marginLeft': '10px', 'fontWeight': 'bold'}),
-                html.P(f"• Failed: {len(filtered_df) - int(filtered_df['Class'].sum())} ({(1-filtered_df['Class'].mean())*100:.1f}%)", 
-                       style={'color': colors['danger'], 'fontSize': '14px', 'marginLeft': '10px'}),
-                
-                html.H4('🎯 Key Findings:', style={'color': colors['text'], 'fontSize': '18px', 'marginTop': '20px'}),
-                html.P(f"• Most active site: {site_success.index[0]} ({int(site_success.iloc[0]['Total'])} launches)", 
-                       style={'color': colors['text'], 'fontSize': '14px', 'marginLeft': '10px'}),
-                html.P(f"• Highest success rate: {site_success.sort_values('Rate', ascending=False).index[0]} ({site_success.sort_values('Rate', ascending=False).iloc[0]['Rate']*100:.1f}%)", 
-                       style={'color': colors['text'], 'fontSize': '14px', 'marginLeft': '10px'}),
-            ])
-        ]
+        best_rate = site_success.sort_values('Rate', ascending=False)
+
+        return fill_outputs(pie_insight_outputs, {
+            'pie-insights-all.hidden': False,
+            'pie-insights-site.hidden': True,
+            'pie-top1-site.children': site_success.index[0],
+            'pie-top1-successful.children': f"{int(site_success.iloc[0]['Successful'])}",
+            'pie-top1-rate.children': f"{site_success.iloc[0]['Rate']*100:.1f}%",
+            'pie-top2-site.children': site_success.index[1],
+            'pie-top2-successful.children': f"{int(site_success.iloc[1]['Successful'])}",
+            'pie-top2-rate.children': f"{site_success.iloc[1]['Rate']*100:.1f}%",
+            'pie-all-total.children': f"{len(filtered_df)}",
+            'pie-all-successful.children': f"{int(filtered_df['Class'].sum())}",
+            'pie-all-success-rate.children': f"{filtered_df['Class'].mean()*100:.1f}%",
+            'pie-all-failed.children': f"{len(filtered_df) - int(filtered_df['Class'].sum())}",
+            'pie-all-failed-rate.children': f"{(1-filtered_df['Class'].mean())*100:.1f}%",
+            'pie-most-active-site.children': site_success.index[0],
+            'pie-most-active-total.children': f"{int(site_success.iloc[0]['Total'])}",
+            'pie-best-rate-site.children': best_rate.index[0],
+            'pie-best-rate.children': f"{best_rate.iloc[0]['Rate']*100:.1f}%",
+        })
     else:
         filtered_df = spacex_df[spacex_df['LaunchSite'] == entered_site]
         total = len(filtered_df)
@@ -300,34 +557,28 @@ def update_pie_insights(entered_site):
         failed = total - successful
         success_rate = (successful / total * 100) if total > 0 else 0
         
-        insights = [
-            html.H3(f'📊 {entered_site} Insights', style={'color': colors['primary'], 'marginBottom': '20px'}),
-            html.Div([
-                html.H4('📈 Performance Metrics:', style={'color': colors['text'], 'fontSize': '18px', 'marginTop': '15px'}),
-                html.P(f"• Total Launches: {total}", 
-                       style={'color': colors['text'], 'fontSize': '14px', 'marginLeft': '10px'}),
-                html.P(f"• Successful: {int(successful)} ({success_rate:.1f}%)", 
-                       style={'color': colors['success'], 'fontSize': '14px', 'marginLeft': '10px', 'fontWeight': 'bold'}),
-                html.P(f"• Failed: {int(failed)} ({100-success_rate:.1f}%)", 
-                       style={'color': colors['danger'], 'fontSize': '14px', 'marginLeft': '10px'}),
-                
-                html.H4('🎯 Analysis:', style={'color': colors['text'], 'fontSize': '18px', 'marginTop': '20px'}),
-                html.P(f"• This site shows a {success_rate:.1f}% success rate", 
-                       style={'color': colors['text'], 'fontSize': '14px', 'marginLeft': '10px'}),
-                html.P(f"• Average payload: {filtered_df['PayloadMass'].mean():,.0f} kg", 
-                       style={'color': colors['text'], 'fontSize': '14px', 'marginLeft': '10px'}),
-            ])
-        ]
-    
-    return html.Div(insights)
+        return fill_outputs(pie_insight_outputs, {
+            'pie-insights-all.hidden': True,
+            'pie-insights-site.hidden': False,
+            'pie-site-name.children': entered_site,
+            'pie-site-total.children': f"{total}",
+            'pie-site-successful.children': f"{int(successful)}",
+            'pie-site-success-rate.children': f"{success_rate:.1f}%",
+            'pie-site-failed.children': f"{int(failed)}",
+            'pie-site-failed-rate.children': f"{100-success_rate:.1f}%",
+            'pie-site-analysis-rate.children': f"{success_rate:.1f}%",
+            'pie-site-avg-payload.children': f"{filtered_df['PayloadMass'].mean():,.0f}",
+        })
 
 # TASK 2:
 # Add a callback function for `site-dropdown` as input, `success-pie-chart` as output
 @app.callback(
     Output(component_id='success-pie-chart', component_property='figure'),
-    Input(component_id='site-dropdown', component_property='value')
+    Input(component_id='site-dropdown', component_property='value'),
+    prevent_initial_call=True
 )
 def get_pie_chart(entered_site):
+    spacex_df = load_launch_data()
     if entered_site == 'ALL':
         fig = px.pie(
             spacex_df,
@@ -359,32 +610,35 @@ def get_pie_chart(entered_site):
     return fig
 
 # Callback for Scatter Plot Insights
+scatter_insight_outputs = slot_outputs(
+    'scatter-insights-body.hidden', 'scatter-insights-empty.hidden',
+    'scatter-range.children', 'scatter-total.children', 'scatter-rate.children',
+    'scatter-low-rate.children', 'scatter-low-count.children',
+    'scatter-high-rate.children', 'scatter-high-count.children',
+    'scatter-avg-payload.children', 'scatter-trend.children',
+)
+
 @app.callback(
-    Output('scatter-insights', 'children'),
+    scatter_insight_outputs,
     [Input('site-dropdown', 'value'),
-     Input('payload-slider', 'value')]
+     Input('payload-slider', 'value'),
+     Input('scatter-visible', 'data')],
+    prevent_initial_call=True
 )
-def update_scatter_insights(entered_site, payload_range):
+def update_scatter_insights(entered_site, payload_range, visible):
+    if not visible:
+        raise PreventUpdate
+    spacex_df = load_launch_data()
     min_payload, max_payload = payload_range
-    
-    if entered_site == 'ALL':
-        filtered_df = spacex_df
-        site_text = "all sites"
-    else:
-        filtered_df = spacex_df[spacex_df['LaunchSite'] == entered_site]
-        site_text = entered_site
-    
-    filtered_df = filtered_df[
-        (filtered_df['PayloadMass'] >= min_payload) &
-        (filtered_df['PayloadMass'] <= max_payload)
-    ]
+    site_text = "all sites" if entered_site == 'ALL' else entered_site
+    filtered_df = filter_launches(spacex_df, entered_site, payload_range)
     
     total = len(filtered_df)
     if total == 0:
-        return html.Div([
-            html.H3('📊 Payload Analysis', style={'color': colors['primary'], 'marginBottom': '20px'}),
-            html.P('No data available for selected filters', style={'color': colors['text']})
-        ])
+        return fill_outputs(scatter_insight_outputs, {
+            'scatter-insights-body.hidden': True,
+            'scatter-insights-empty.hidden': False,
+        })
     
     successful = filtered_df['Class'].sum()
     success_rate = (successful / total * 100)
@@ -396,52 +650,34 @@ def update_scatter_insights(entered_site, payload_range):
     low_success_rate = (low_payload['Class'].mean() * 100) if len(low_payload) > 0 else 0
     high_success_rate = (high_payload['Class'].mean() * 100) if len(high_payload) > 0 else 0
     
-    insights = [
-        html.H3('📊 Payload Analysis', style={'color': colors['primary'], 'marginBottom': '20px', 'fontSize': '20px'}),
-        html.Div([
-            html.H4('📈 Range Overview:', style={'color': colors['text'], 'fontSize': '16px', 'marginTop': '15px'}),
-            html.P(f"• Payload Range: {min_payload:,.0f} - {max_payload:,.0f} kg", 
-                   style={'color': colors['text'], 'fontSize': '13px', 'marginLeft': '10px'}),
-            html.P(f"• Total Launches: {total}", 
-                   style={'color': colors['text'], 'fontSize': '13px', 'marginLeft': '10px'}),
-            html.P(f"• Success Rate: {success_rate:.1f}%", 
-                   style={'color': colors['success'], 'fontSize': '13px', 'marginLeft': '10px', 'fontWeight': 'bold'}),
-            
-            html.H4('🎯 Correlation:', style={'color': colors['text'], 'fontSize': '16px', 'marginTop': '20px'}),
-            html.P(f"• Low Payload (<5000kg): {low_success_rate:.1f}% success ({len(low_payload)} launches)", 
-                   style={'color': colors['text'], 'fontSize': '13px', 'marginLeft': '10px'}),
-            html.P(f"• High Payload (≥5000kg): {high_success_rate:.1f}% success ({len(high_payload)} launches)", 
-                   style={'color': colors['text'], 'fontSize': '13px', 'marginLeft': '10px'}),
-            
-            html.H4('💡 Insight:', style={'color': colors['text'], 'fontSize': '16px', 'marginTop': '20px'}),
-            html.P(f"• Average payload: {avg_payload:,.0f} kg", 
-                   style={'color': colors['text'], 'fontSize': '13px', 'marginLeft': '10px'}),
-            html.P(f"• {'Higher' if high_success_rate > low_success_rate else 'Lower'} payloads show better success rates", 
-                   style={'color': colors['primary'], 'fontSize': '13px', 'marginLeft': '10px', 'fontWeight': 'bold'}),
-        ])
-    ]
-    
-    return html.Div(insights)
+    return {
+        'scatter-insights-body.hidden': False,
+        'scatter-insights-empty.hidden': True,
+        'scatter-range.children': f"{min_payload:,.0f} - {max_payload:,.0f}",
+        'scatter-total.children': f"{total}",
+        'scatter-rate.children': f"{success_rate:.1f}%",
+        'scatter-low-rate.children': f"{low_success_rate:.1f}%",
+        'scatter-low-count.children': f"{len(low_payload)}",
+        'scatter-high-rate.children': f"{high_success_rate:.1f}%",
+        'scatter-high-count.children': f"{len(high_payload)}",
+        'scatter-avg-payload.children': f"{avg_payload:,.0f}",
+        'scatter-trend.children': 'Higher' if high_success_rate > low_success_rate else 'Lower',
+    }
 
 # TASK 4:
 # Add a callback function for `site-dropdown` and `payload-slider` as inputs, `success-payload-scatter-chart` as output
 @app.callback(
     Output(component_id='success-payload-scatter-chart', component_property='figure'),
     [Input(component_id='site-dropdown', component_property='value'),
-     Input(component_id='payload-slider', component_property='value')]
+     Input(component_id='payload-slider', component_property='value'),
+     Input(component_id='scatter-visible', component_property='data')],
+    prevent_initial_call=True
 )
-def get_scatter_chart(entered_site, payload_range):
-    min_payload, max_payload = payload_range
-    
-    if entered_site == 'ALL':
-        filtered_df = spacex_df
-    else:
-        filtered_df = spacex_df[spacex_df['LaunchSite'] == entered_site]
-    
-    filtered_df = filtered_df[
-        (filtered_df['PayloadMass'] >= min_payload) &
-        (filtered_df['PayloadMass'] <= max_payload)
-    ]
+def get_scatter_chart(entered_site, payload_range, visible):
+    if not visible:
+        raise PreventUpdate
+    spacex_df = load_launch_data()
+    filtered_df = filter_launches(spacex_df, entered_site, payload_range)
     
     fig = px.scatter(
         filtered_df,
@@ -466,12 +702,30 @@ def get_scatter_chart(entered_site, payload_range):
     
     return fig
 
+# Callback for Export Links (rows behind the scatter chart)
+@app.callback(
+    [Output('export-csv-link', 'href'),
+     Output('export-parquet-link', 'href')],
+    [Input('site-dropdown', 'value'),
+     Input('payload-slider', 'value')],
+    prevent_initial_call=True
+)
+def update_export_links(entered_site, payload_range):
+    query = {'site': entered_site, 'payload_min': payload_range[0], 'payload_max': payload_range[1], 'gzip': 1}
+    return (f"/export/launches?{urlencode({**query, 'format': 'csv'})}",
+            f"/export/launches?{urlencode({**query, 'format': 'parquet'})}")
+
 # Callback for Orbit Success Bar Chart
 @app.callback(
     Output('orbit-success-bar-chart', 'figure'),
-    Input('site-dropdown', 'value')
+    [Input('site-dropdown', 'value'),
+     Input('orbit-visible', 'data')],
+    prevent_initial_call=True
 )
-def get_orbit_chart(entered_site):
+def get_orbit_chart(entered_site, visible):
+    if not visible:
+        raise PreventUpdate
+    spacex_df = load_launch_data()
     if entered_site == 'ALL':
         filtered_df = spacex_df
     else:
@@ -511,10 +765,19 @@ def get_orbit_chart(entered_site):
 
 # Callback for Orbit Insights
 @app.callback(
-    Output('orbit-insights', 'children'),
-    Input('site-dropdown', 'value')
+    slot_outputs(
+        'orbit-best.children', 'orbit-best-rate.children', 'orbit-best-successful.children', 'orbit-best-total.children',
+        'orbit-common.children', 'orbit-common-total.children', 'orbit-common-rate.children',
+        'orbit-types.children', 'orbit-site.children', 'orbit-range-low.children', 'orbit-range-high.children',
+    ),
+    [Input('site-dropdown', 'value'),
+     Input('orbit-visible', 'data')],
+    prevent_initial_call=True
 )
-def update_orbit_insights(entered_site):
+def update_orbit_insights(entered_site, visible):
+    if not visible:
+        raise PreventUpdate
+    spacex_df = load_launch_data()
     if entered_site == 'ALL':
         filtered_df = spacex_df
         site_text = "all sites"
@@ -533,37 +796,31 @@ def update_orbit_insights(entered_site):
     worst_orbit = orbit_stats.iloc[-1]
     most_used = orbit_stats.sort_values('Total', ascending=False).iloc[0]
     
-    insights = [
-        html.H3('🛰️ Orbit Analysis', style={'color': colors['primary'], 'marginBottom': '20px'}),
-        html.Div([
-            html.H4('🏆 Best Performing:', style={'color': colors['text'], 'fontSize': '18px', 'marginTop': '15px'}),
-            html.P(f"• {best_orbit['Orbit']} orbit: {best_orbit['SuccessRate']:.1f}% success rate", 
-                   style={'color': colors['success'], 'fontSize': '14px', 'marginLeft': '10px', 'fontWeight': 'bold'}),
-            html.P(f"  ({int(best_orbit['Successful'])} of {int(best_orbit['Total'])} launches)", 
-                   style={'color': colors['text'], 'fontSize': '13px', 'marginLeft': '20px'}),
-            
-            html.H4('📊 Most Common:', style={'color': colors['text'], 'fontSize': '18px', 'marginTop': '20px'}),
-            html.P(f"• {most_used['Orbit']} orbit: {int(most_used['Total'])} total launches", 
-                   style={'color': colors['text'], 'fontSize': '14px', 'marginLeft': '10px'}),
-            html.P(f"  ({most_used['SuccessRate']:.1f}% success rate)", 
-                   style={'color': colors['text'], 'fontSize': '13px', 'marginLeft': '20px'}),
-            
-            html.H4('💡 Key Finding:', style={'color': colors['text'], 'fontSize': '18px', 'marginTop': '20px'}),
-            html.P(f"• {len(orbit_stats)} different orbit types used at {site_text}", 
-                   style={'color': colors['text'], 'fontSize': '14px', 'marginLeft': '10px'}),
-            html.P(f"• Success rates vary from {worst_orbit['SuccessRate']:.1f}% to {best_orbit['SuccessRate']:.1f}%", 
-                   style={'color': colors['primary'], 'fontSize': '14px', 'marginLeft': '10px', 'fontWeight': 'bold'}),
-        ])
-    ]
-    
-    return html.Div(insights)
+    return {
+        'orbit-best.children': best_orbit['Orbit'],
+        'orbit-best-rate.children': f"{best_orbit['SuccessRate']:.1f}%",
+        'orbit-best-successful.children': f"{int(best_orbit['Successful'])}",
+        'orbit-best-total.children': f"{int(best_orbit['Total'])}",
+        'orbit-common.children': most_used['Orbit'],
+        'orbit-common-total.children': f"{int(most_used['Total'])}",
+        'orbit-common-rate.children': f"{most_used['SuccessRate']:.1f}%",
+        'orbit-types.children': f"{len(orbit_stats)}",
+        'orbit-site.children': site_text,
+        'orbit-range-low.children': f"{worst_orbit['SuccessRate']:.1f}%",
+        'orbit-range-high.children': f"{best_orbit['SuccessRate']:.1f}%",
+    }
 
 # Callback for Timeline Chart
 @app.callback(
     Output('timeline-chart', 'figure'),
-    Input('site-dropdown', 'value')
+    [Input('site-dropdown', 'value'),
+     Input('timeline-visible', 'data')],
+    prevent_initial_call=True
 )
-def get_timeline_chart(entered_site):
+def get_timeline_chart(entered_site, visible):
+    if not visible:
+        raise PreventUpdate
+    spacex_df = load_launch_data()
     if entered_site == 'ALL':
         filtered_df = spacex_df.copy()
     else:
@@ -605,10 +862,21 @@ def get_timeline_chart(entered_site):
 
 # Callback for Timeline Insights
 @app.callback(
-    Output('timeline-insights', 'children'),
-    Input('site-dropdown', 'value')
+    slot_outputs(
+        'timeline-first.children', 'timeline-last.children', 'timeline-days.children', 'timeline-years.children',
+        'timeline-early-rate.children', 'timeline-early-count.children',
+        'timeline-late-rate.children', 'timeline-late-count.children', 'timeline-recent-line.className',
+        'timeline-improvement.children', 'timeline-improvement-line.className',
+        'timeline-overall-rate.children', 'timeline-verdict.children', 'timeline-outlook.children',
+    ),
+    [Input('site-dropdown', 'value'),
+     Input('timeline-visible', 'data')],
+    prevent_initial_call=True
 )
-def update_timeline_insights(entered_site):
+def update_timeline_insights(entered_site, visible):
+    if not visible:
+        raise PreventUpdate
+    spacex_df = load_launch_data()
     if entered_site == 'ALL':
         filtered_df = spacex_df.copy()
         site_text = "all sites"
@@ -632,47 +900,175 @@ def update_timeline_insights(entered_site):
     
     final_success_rate = (filtered_df['Class'].sum() / len(filtered_df)) * 100
     
-    insights = html.Div([
-        html.Div([
-            html.H3('📅 Timeline Analysis', style={'color': colors['primary'], 'marginBottom': '20px'}),
-        ], style={'width': '100%'}),
-        
-        html.Div([
-            html.Div([
-                html.H4('📆 Period Overview:', style={'color': colors['text'], 'fontSize': '18px', 'marginTop': '15px'}),
-                html.P(f"• First Launch: {first_launch.strftime('%Y-%m-%d')}", 
-                       style={'color': colors['text'], 'fontSize': '14px', 'marginLeft': '10px'}),
-                html.P(f"• Latest Launch: {last_launch.strftime('%Y-%m-%d')}", 
-                       style={'color': colors['text'], 'fontSize': '14px', 'marginLeft': '10px'}),
-                html.P(f"• Time Span: {days_span} days ({days_span/365:.1f} years)", 
-                       style={'color': colors['text'], 'fontSize': '14px', 'marginLeft': '10px'}),
-            ], style={'width': '33%', 'display': 'inline-block', 'verticalAlign': 'top'}),
-            
-            html.Div([
-                html.H4('📈 Performance Trend:', style={'color': colors['text'], 'fontSize': '18px', 'marginTop': '15px'}),
-                html.P(f"• Early Period: {early_success:.1f}% success ({len(early_period)} launches)", 
-                       style={'color': colors['text'], 'fontSize': '14px', 'marginLeft': '10px'}),
-                html.P(f"• Recent Period: {late_success:.1f}% success ({len(late_period)} launches)", 
-                       style={'color': colors['success'] if late_success > early_success else colors['danger'], 
-                              'fontSize': '14px', 'marginLeft': '10px', 'fontWeight': 'bold'}),
-                html.P(f"• Improvement: {late_success - early_success:+.1f}%", 
-                       style={'color': colors['success'] if late_success > early_success else colors['danger'], 
-                              'fontSize': '14px', 'marginLeft': '10px'}),
-            ], style={'width': '33%', 'display': 'inline-block', 'verticalAlign': 'top'}),
-            
-            html.Div([
-                html.H4('💡 Key Insights:', style={'color': colors['text'], 'fontSize': '18px', 'marginTop': '15px'}),
-                html.P(f"• Overall Success Rate: {final_success_rate:.1f}%", 
-                       style={'color': colors['primary'], 'fontSize': '14px', 'marginLeft': '10px', 'fontWeight': 'bold'}),
-                html.P(f"• Performance {'improved' if late_success > early_success else 'declined'} over time", 
-                       style={'color': colors['text'], 'fontSize': '14px', 'marginLeft': '10px'}),
-                html.P(f"• Technology and procedures have {'evolved positively' if late_success > early_success else 'faced challenges'}", 
-                       style={'color': colors['text'], 'fontSize': '14px', 'marginLeft': '10px'}),
-            ], style={'width': '33%', 'display': 'inline-block', 'verticalAlign': 'top'}),
-        ], style={'width': '100%', 'display': 'block'})
-    ])
-    
-    return insights
+    improved = late_success > early_success
+    trend_tone = 'success' if improved else 'danger'
+
+    return {
+        'timeline-first.children': first_launch.strftime('%Y-%m-%d'),
+        'timeline-last.children': last_launch.strftime('%Y-%m-%d'),
+        'timeline-days.children': f"{days_span}",
+        'timeline-years.children': f"{days_span/365:.1f}",
+        'timeline-early-rate.children': f"{early_success:.1f}%",
+        'timeline-early-count.children': f"{len(early_period)}",
+        'timeline-late-rate.children': f"{late_success:.1f}%",
+        'timeline-late-count.children': f"{len(late_period)}",
+        'timeline-recent-line.className': insight_class(trend_tone, strong=True),
+        'timeline-improvement.children': f"{late_success - early_success:+.1f}%",
+        'timeline-improvement-line.className': insight_class(trend_tone),
+        'timeline-overall-rate.children': f"{final_success_rate:.1f}%",
+        'timeline-verdict.children': 'improved' if improved else 'declined',
+        'timeline-outlook.children': 'evolved positively' if improved else 'faced challenges',
+    }
+
+# ============================================================================
+# INITIAL STATE
+# ============================================================================
+
+# The above-the-fold stats cards and pie chart are rendered into the layout
+# up front, so the first paint needs no callback round-trips. Below-the-fold
+# sections are filled in by their callbacks once assets/lazy_sections.js
+# reports them as visible.
+def build_initial_state():
+    """Compute the above-the-fold outputs for the default selection, keyed by 'id.property'."""
+    initial_site = 'ALL'
+    csv_href, parquet_href = update_export_links(initial_site, [min_payload, max_payload])
+    state = {**update_stats_cards(initial_site), **update_pie_insights(initial_site)}
+    return {
+        **{key: value for key, value in state.items() if value is not no_update},
+        'success-pie-chart.figure': json.loads(get_pie_chart(initial_site).to_json()),
+        'export-csv-link.href': csv_href,
+        'export-parquet-link.href': parquet_href,
+    }
+
+
+def write_snapshot(path=SNAPSHOT_PATH):
+    """Write the dataset, payload bounds and initial outputs to a single binary snapshot."""
+    spacex_df = load_launch_data()
+    data = {
+        'fingerprint': snapshot_fingerprint(),
+        'launch_data': pickle.dumps(spacex_df, protocol=pickle.HIGHEST_PROTOCOL),
+        'min_payload': float(spacex_df['PayloadMass'].min()),
+        'max_payload': float(spacex_df['PayloadMass'].max()),
+        'initial_state': build_initial_state(),
+    }
+    with open(path + '.tmp', 'wb') as f:
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(path + '.tmp', path)
+
+
+initial_state = snapshot['initial_state'] if snapshot is not None else build_initial_state()
+for key, value in initial_state.items():
+    component_id, prop = key.rsplit('.', 1)
+    setattr(app.layout[component_id], prop, value)
+
+# ============================================================================
+# DATA EXPORT
+# ============================================================================
+
+# Rows read from the CSV per chunk; only one chunk is ever held in memory
+EXPORT_CHUNK_ROWS = 50_000
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object that hands written bytes back to a generator."""
+
+    def __init__(self):
+        self._parts = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._parts.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        data = b''.join(self._parts)
+        self._parts = []
+        return data
+
+
+def iter_filtered_chunks(entered_site, payload_range):
+    """Re-read the CSV in chunks and apply the chart filters to each one."""
+    dtypes = load_launch_data().dtypes.to_dict()
+    for chunk in pd.read_csv(csv_path, chunksize=EXPORT_CHUNK_ROWS, dtype=dtypes):
+        yield filter_launches(chunk, entered_site, payload_range)
+
+
+def iter_csv_bytes(chunks):
+    header = True
+    for chunk in chunks:
+        if header or len(chunk):
+            yield chunk.to_csv(index=False, header=header).encode('utf-8')
+            header = False
+
+
+def iter_parquet_bytes(chunks):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.Schema.from_pandas(load_launch_data(), preserve_index=False)
+    sink = _ChunkSink()
+    with pq.ParquetWriter(sink, schema) as writer:
+        for chunk in chunks:
+            if len(chunk):
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+                yield sink.drain()
+    yield sink.drain()
+
+
+def iter_gzip(stream):
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    for data in stream:
+        compressed = compressor.compress(data)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+@app.server.route('/export/launches')
+def export_launches():
+    """Stream the rows behind the scatter chart as CSV or Parquet.
+
+    Query parameters mirror the dashboard controls: `site`, `payload_min`,
+    `payload_max`, plus `format` (csv | parquet) and `gzip` (0 | 1).
+    """
+    entered_site = request.args.get('site', 'ALL')
+    if entered_site not in [option['value'] for option in app.layout['site-dropdown'].options]:
+        abort(400, 'site must be ALL or one of the site-dropdown values')
+    export_format = request.args.get('format', 'csv')
+    use_gzip = request.args.get('gzip', '0') in ('1', 'true', 'yes')
+    try:
+        payload_range = [float(request.args.get('payload_min', min_payload)),
+                         float(request.args.get('payload_max', max_payload))]
+    except ValueError:
+        abort(400, 'payload_min and payload_max must be numbers')
+
+    if export_format == 'csv':
+        stream, mimetype = iter_csv_bytes(iter_filtered_chunks(entered_site, payload_range)), 'text/csv'
+    elif export_format == 'parquet':
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            abort(501, 'Parquet export requires pyarrow')
+        stream, mimetype = iter_parquet_bytes(iter_filtered_chunks(entered_site, payload_range)), 'application/vnd.apache.parquet'
+    else:
+        abort(400, 'format must be csv or parquet')
+
+    filename = f"spacex_launches_{entered_site.replace(' ', '_')}.{export_format}"
+    if use_gzip:
+        stream, mimetype, filename = iter_gzip(stream), 'application/gzip', filename + '.gz'
+
+    return Response(
+        stream_with_context(stream),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+    )
 
 # Run the app
 if __name__ == '__main__':